@@ -43,4 +43,18 @@ describe('HighScores component', () => {
     expect(listItems).toHaveLength(10);
     expect(listItems[0]).toHaveTextContent('1500'); // Highest score
   });
+
+  it('picks up scores written after an earlier render', () => {
+    localStorage.setItem('highScores', JSON.stringify([100]));
+    const { unmount } = render(<HighScores />);
+    expect(screen.getAllByRole('listitem')).toHaveLength(1);
+    unmount();
+
+    localStorage.setItem('highScores', JSON.stringify([100, 200]));
+    render(<HighScores />);
+
+    const listItems = screen.getAllByRole('listitem');
+    expect(listItems).toHaveLength(2);
+    expect(listItems[0]).toHaveTextContent('200');
+  });
 });
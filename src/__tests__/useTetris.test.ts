@@ -113,6 +113,12 @@ describe('useTetris', () => {
       // No need to clean up module-level mock
     });
 
+    it('overwrites invalid localStorage data when saving a score', () => {
+      localStorage.setItem('highScores', 'invalid-json');
+      expect(() => saveHighScore(100)).not.toThrow();
+      expect(JSON.parse(localStorage.getItem('highScores')!)).toEqual([100]);
+    });
+
     it('maintains only top 10 scores in descending order', () => {
       const scores = Array.from({ length: 15 }, (_, i) => i * 100);
       localStorage.setItem('highScores', JSON.stringify(scores));
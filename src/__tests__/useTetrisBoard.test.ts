@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { hasCollisions, getEmptyBoard, BOARD_HEIGHT, BOARD_WIDTH } from '../hooks/useTetrisBoard';
+import { hasCollisions, getEmptyBoard, getRandomBlock, BOARD_HEIGHT, BOARD_WIDTH } from '../hooks/useTetrisBoard';
 import { Block, SHAPES } from '../types';
 
 describe('useTetrisBoard', () => {
@@ -11,6 +11,14 @@ describe('useTetrisBoard', () => {
     });
   });
 
+  describe('getRandomBlock', () => {
+    it('returns a valid block type', () => {
+      for (let i = 0; i < 50; i++) {
+        expect(Object.values(Block)).toContain(getRandomBlock());
+      }
+    });
+  });
+
   describe('hasCollisions', () => {
     it('detects bottom wall collision', () => {
       const board = getEmptyBoard();
@@ -45,6 +53,14 @@ describe('useTetrisBoard', () => {
       expect(collision).toBe(true);
     });
 
+    it('detects collision with an occupied cell', () => {
+      const board = getEmptyBoard();
+      board[5][4] = Block.T;
+      const shape = SHAPES[Block.I].shape;
+      expect(hasCollisions(board, shape, 5, 3)).toBe(true);
+      expect(hasCollisions(board, shape, 4, 3)).toBe(false);
+    });
+
     it('returns false for valid position', () => {
       const board = getEmptyBoard();
       const shape = SHAPES[Block.I].shape;
@@ -2,7 +2,7 @@ import React from 'react';
 import { GetHighScores } from '../hooks/useTetris';
 
 function HighScores() {
-  const highScores = GetHighScores().slice(0, 10);
+  const highScores = GetHighScores();
   
   if (highScores.length === 0) {
     return (
@@ -1,4 +1,14 @@
-import { Block, SHAPES } from '../types';
+import { Block, BlockShape, SHAPES } from '../types';
+import { hasSetCells } from '../hooks/useTetrisBoard';
+
+// Each block's shape with its empty rows removed. SHAPES never changes, so
+// this is computed once rather than on every render of the preview.
+const PREVIEW_SHAPES = Object.fromEntries(
+  Object.values(Block).map((block) => [
+    block,
+    SHAPES[block].shape.filter(hasSetCells),
+  ])
+) as Record<Block, BlockShape>;
 
 interface Props {
   upcomingBlocks: Block[];
@@ -8,9 +18,7 @@ function UpcomingBlocks({ upcomingBlocks }: Props) {
   return (
     <div className="upcoming">
       {upcomingBlocks.map((block, blockIndex) => {
-        const shape = SHAPES[block].shape.filter((row) =>
-          row.some((cell) => cell)
-        );
+        const shape = PREVIEW_SHAPES[block];
         return (
           <div key={blockIndex}>
             {shape.map((row, rowIndex) => {
@@ -1,25 +1,41 @@
 import    {useCallback, useEffect, useState } from 'react';
 import      {Block, BlockShape, BoardShape, EmptyCell, SHAPES } from '../types';
 import {  useInterval } from './useInterval';
-import { useTetrisBoard, hasCollisions, BOARD_HEIGHT, getEmptyBoard, getRandomBlock,} from './useTetrisBoard';
+import { useTetrisBoard, hasCollisions, hasSetCells, BOARD_HEIGHT, getEmptyBoard, getRandomBlock,} from './useTetrisBoard';
 
 const max_High_scores = 10;
 
-// Function... seems self explanatory to me 
-export function saveHighScore(score: number): void {
-  const existingScores = JSON.parse(localStorage.getItem('highScores') || '[]');
-  existingScores.push(score);
-  const updatedScores = existingScores.sort((a: number, b: number) => b - a)
-    .slice(0, max_High_scores);
-    localStorage.setItem('highScores', JSON.stringify(updatedScores));
-}
+// GetHighScores runs on every render, so remember the last raw localStorage
+// value and the scores parsed from it; only re-parse when the string changes.
+let cachedRawScores: string | null = null;
+let cachedHighScores: number[] = [];
 
-// Function... also self explanatory 
+// Returns the top high scores (highest first) from localStorage, or an empty
+// list if nothing valid is stored. Callers get a copy they are free to mutate.
 export function GetHighScores(): number[] {
-      try { const scores = JSON.parse(localStorage.getItem('highScores') || '[]');
-    return Array.isArray(scores) ? scores.sort((a, b) => b - a).slice(0, max_High_scores) : [];
-  } catch {return [];
+  const rawScores = localStorage.getItem('highScores') || '[]';
+  if (rawScores !== cachedRawScores) {
+    try {
+      const scores = JSON.parse(rawScores);
+      cachedHighScores = Array.isArray(scores)
+        ? scores.sort((a, b) => b - a).slice(0, max_High_scores)
+        : [];
+    } catch {
+      cachedHighScores = [];
+    }
+    cachedRawScores = rawScores;
   }
+  return [...cachedHighScores];
+}
+
+// Adds a score to the stored high scores, keeping only the top entries.
+// Reads through GetHighScores so missing or corrupt data is treated as empty
+// instead of throwing at game over.
+export function saveHighScore(score: number): void {
+  const updatedScores = [...GetHighScores(), score]
+    .sort((a, b) => b - a)
+    .slice(0, max_High_scores);
+  localStorage.setItem('highScores', JSON.stringify(updatedScores));
 }
 
 // this does something with the board, but I'm not sure what
@@ -63,7 +79,8 @@ export function useTetris() {
       return;
     }
 
-    const newBoard = structuredClone(board) as BoardShape;
+    // Rows only hold enum strings, so copying each row is a full copy.
+    const newBoard: BoardShape = board.map((row) => [...row]);
     addShapeToBoard(
       newBoard,
       droppingBlock,
@@ -80,7 +97,7 @@ export function useTetris() {
       }
     }
 
-    const newUpcomingBlocks = structuredClone(upcomingBlocks) as Block[];
+    const newUpcomingBlocks = [...upcomingBlocks];
     const newBlock = newUpcomingBlocks.pop() as Block;
     newUpcomingBlocks.unshift(getRandomBlock());
 
@@ -168,41 +185,42 @@ export function useTetris() {
         return;
       }
 
-      if (event.key === 'ArrowDown') {
-        setTickSpeed(TickSpeed.Fast);
-      }
-
-      if (event.key === 'ArrowUp') {
-        dispatchBoardState({
-          type: 'move',
-          isRotating: true,
-        });
-      }
-
-      if (event.key === 'ArrowLeft') {
-        isPressingLeft = true;
-        updateMovementInterval();
-      }
-
-      if (event.key === 'ArrowRight') {
-        isPressingRight = true;
-        updateMovementInterval();
+      // A key event only ever matches one arrow, so dispatch on it once
+      // instead of comparing against every key in turn.
+      switch (event.key) {
+        case 'ArrowDown':
+          setTickSpeed(TickSpeed.Fast);
+          break;
+        case 'ArrowUp':
+          dispatchBoardState({
+            type: 'move',
+            isRotating: true,
+          });
+          break;
+        case 'ArrowLeft':
+          isPressingLeft = true;
+          updateMovementInterval();
+          break;
+        case 'ArrowRight':
+          isPressingRight = true;
+          updateMovementInterval();
+          break;
       }
     };
 
     const handleKeyUp = (event: KeyboardEvent) => {
-      if (event.key === 'ArrowDown') {
-        setTickSpeed(TickSpeed.Normal);
-      }
-
-      if (event.key === 'ArrowLeft') {
-        isPressingLeft = false;
-        updateMovementInterval();
-      }
-
-      if (event.key === 'ArrowRight') {
-        isPressingRight = false;
-        updateMovementInterval();
+      switch (event.key) {
+        case 'ArrowDown':
+          setTickSpeed(TickSpeed.Normal);
+          break;
+        case 'ArrowLeft':
+          isPressingLeft = false;
+          updateMovementInterval();
+          break;
+        case 'ArrowRight':
+          isPressingRight = false;
+          updateMovementInterval();
+          break;
       }
     };
 
@@ -216,7 +234,7 @@ export function useTetris() {
     };
   }, [dispatchBoardState, isPlaying]);
 
-  const renderedBoard = structuredClone(board) as BoardShape;
+  const renderedBoard: BoardShape = board.map((row) => [...row]);
   if (isPlaying) {
     addShapeToBoard(
       renderedBoard,
@@ -237,21 +255,15 @@ export function useTetris() {
   };
 }
 
+// Points awarded for clearing N rows at once, indexed by N (0-4).
+const POINTS_PER_ROWS_CLEARED = [0, 100, 300, 500, 800] as const;
+
 function getPoints(numCleared: number): number {
-  switch (numCleared) {
-    case 0:
-      return 0;
-    case 1:
-      return 100;
-    case 2:
-      return 300;
-    case 3:
-      return 500;
-    case 4:
-      return 800;
-    default:
-      throw new Error('Unexpected number of rows cleared');
+  const points = POINTS_PER_ROWS_CLEARED[numCleared];
+  if (points === undefined) {
+    throw new Error('Unexpected number of rows cleared');
   }
+  return points;
 }
 
 function addShapeToBoard(
@@ -261,14 +273,19 @@ function addShapeToBoard(
   droppingRow: number,
   droppingColumn: number
 ) {
-  droppingShape
-    .filter((row) => row.some((isSet) => isSet))
-    .forEach((row: boolean[], rowIndex: number) => {
-      row.forEach((isSet: boolean, colIndex: number) => {
-        if (isSet) {
-          board[droppingRow + rowIndex][droppingColumn + colIndex] =
-            droppingBlock;
-        }
-      });
+  // Walk the shape the same way hasCollisions does, so empty rows are skipped
+  // identically and the block lands exactly where the collision check allowed.
+  let rowIndex = 0;
+  for (const row of droppingShape) {
+    if (!hasSetCells(row)) {
+      continue;
+    }
+    row.forEach((isSet: boolean, colIndex: number) => {
+      if (isSet) {
+        board[droppingRow + rowIndex][droppingColumn + colIndex] =
+          droppingBlock;
+      }
     });
+    rowIndex++;
+  }
 }
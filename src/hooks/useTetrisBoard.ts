@@ -40,34 +40,46 @@ export function getEmptyBoard(height = BOARD_HEIGHT): BoardShape {
     .map(() => Array(BOARD_WIDTH).fill(EmptyCell.Empty));
 }
 
+// Whether a row of a block shape contains any set cells. Shapes are padded
+// with empty rows, which collision checks and drawing both skip.
+export function hasSetCells(shapeRow: boolean[]): boolean {
+  return shapeRow.some((isSet) => isSet);
+}
+
 export function hasCollisions(
   board: BoardShape,
   currentShape: BlockShape,
   row: number,
   column: number
 ): boolean {
-  let hasCollision = false;
-  currentShape
-    .filter((shapeRow) => shapeRow.some((isSet) => isSet))
-    .forEach((shapeRow: boolean[], rowIndex: number) => {
-      shapeRow.forEach((isSet: boolean, colIndex: number) => {
-        if (
-          isSet &&
-          (row + rowIndex >= board.length ||
-            column + colIndex >= board[0].length ||
-            column + colIndex < 0 ||
-            board[row + rowIndex][column + colIndex] !== EmptyCell.Empty)
-        ) {
-          hasCollision = true;
-        }
-      });
-    });
-  return hasCollision;
+  // Empty shape rows are skipped without allocating a filtered copy, so
+  // rowIndex only advances on rows that contain at least one set cell.
+  let rowIndex = 0;
+  for (const shapeRow of currentShape) {
+    if (!hasSetCells(shapeRow)) {
+      continue;
+    }
+    for (let colIndex = 0; colIndex < shapeRow.length; colIndex++) {
+      if (
+        shapeRow[colIndex] &&
+        (row + rowIndex >= board.length ||
+          column + colIndex >= board[0].length ||
+          column + colIndex < 0 ||
+          board[row + rowIndex][column + colIndex] !== EmptyCell.Empty)
+      ) {
+        return true;
+      }
+    }
+    rowIndex++;
+  }
+  return false;
 }
 
+// Every block type, computed once instead of on each getRandomBlock call.
+const BLOCK_VALUES = Object.values(Block);
+
 export function getRandomBlock(): Block {
-  const blockValues = Object.values(Block);
-  return blockValues[Math.floor(Math.random() * blockValues.length)] as Block;
+  return BLOCK_VALUES[Math.floor(Math.random() * BLOCK_VALUES.length)];
 }
 
 function rotateBlock(shape: BlockShape): BlockShape {